@@ -18,8 +18,8 @@ def register():
     bake_panel.register()
 
 def unregister():
-    jcurves.unregister()
     bake_panel.unregister()
+    jcurves.unregister()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
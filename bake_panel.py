@@ -56,6 +56,64 @@ class JCurvesBakeProps(bpy.types.PropertyGroup):
     )
 
 
+# GPU DEVICES
+GPU_DEVICE_TYPES = ("OPTIX", "CUDA", "HIP", "ONEAPI", "METAL")
+# Cycles X default, small tiles leave the GPU underused
+GPU_TILE_SIZE = 2048
+
+# Snapshot of the Cycles compute device type and per-device "use" flags,
+# or None if Cycles is unavailable
+def _save_compute_device_type(context):
+    addon = context.preferences.addons.get("cycles")
+    if addon is None:
+        return None
+
+    prefs = addon.preferences
+    prefs.refresh_devices()
+    return prefs.compute_device_type, {device.id: device.use for device in prefs.devices}
+
+# Pick the first available GPU backend and enable its devices.
+# Returns False if no GPU was found.
+def _enable_gpus(context, device_types=GPU_DEVICE_TYPES):
+    addon = context.preferences.addons.get("cycles")
+    if addon is None:
+        return False
+
+    prefs = addon.preferences
+    old_type = prefs.compute_device_type
+
+    for device_type in device_types:
+        try:
+            prefs.compute_device_type = device_type
+        except TypeError:
+            # Backend not compiled into this build
+            continue
+        if any(d.type == device_type for d in prefs.devices):
+            break
+    else:
+        prefs.compute_device_type = old_type
+        return False
+
+    for device in prefs.devices:
+        device.use = device.type != 'CPU'
+
+    return True
+
+def _restore_compute_device_type(context, state):
+    if state is None:
+        return
+    addon = context.preferences.addons.get("cycles")
+    if addon is None:
+        return
+
+    device_type, old_use = state
+    prefs = addon.preferences
+    prefs.compute_device_type = device_type
+    for device in prefs.devices:
+        if device.id in old_use:
+            device.use = old_use[device.id]
+
+
 # BAKE IMAGE
 class MATERIAL_OT_bake_image(bpy.types.Operator):
     bl_idname = "material.bake_image"
@@ -64,52 +122,186 @@ class MATERIAL_OT_bake_image(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
+        # Blocking bake, used when the operator is called from a script
+        if not self._prepare_bake(context):
+            return {'CANCELLED'}
+
+        try:
+            self._apply_bake_settings(context)
+            try:
+                bpy.ops.object.bake(type='DIFFUSE')
+            except RuntimeError:
+                if not self._retry_with_cuda(context):
+                    raise
+                bpy.ops.object.bake(type='DIFFUSE')
+        except RuntimeError as e:
+            self._discard_bake(f"Baking failed: {e}")
+            return {'CANCELLED'}
+        except BaseException:
+            self._discard_bake("Baking was interrupted.")
+            raise
+        finally:
+            # RESTORE SETTINGS
+            self._restore_bake_settings(context, self._saved)
+
+        self._finish_bake(context)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        # Run the bake as a background job so the UI stays responsive
+        if bpy.app.is_job_running('OBJECT_BAKE'):
+            self.report({'ERROR'}, "A bake is already running.")
+            return {'CANCELLED'}
+
+        if not self._prepare_bake(context):
+            return {'CANCELLED'}
+
+        self._timer = None
+        self._bake_result = None
+        self._add_bake_handlers()
+
+        started = False
+        try:
+            self._apply_bake_settings(context)
+            started = self._start_bake_job()
+        except RuntimeError as e:
+            self._discard_bake(f"Baking failed: {e}")
+            return {'CANCELLED'}
+        except BaseException:
+            self._discard_bake("Baking was interrupted.")
+            raise
+        finally:
+            if not started:
+                self._remove_bake_handlers()
+                self._restore_bake_settings(context, self._saved)
+
+        if not started:
+            self._discard_bake("Baking could not be started.")
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or self._timer is None:
+            return {'PASS_THROUGH'}
+        if self._bake_result is None and bpy.app.is_job_running('OBJECT_BAKE'):
+            return {'PASS_THROUGH'}
+
+        # Retry only when the job ended without a signal, a cancel may come from the user
+        if self._bake_result is None and self._retry_with_cuda(context):
+            try:
+                if self._start_bake_job():
+                    return {'PASS_THROUGH'}
+            except RuntimeError:
+                pass
+
+        self._end_bake_job(context)
+        if self._bake_result == 'COMPLETE':
+            self._finish_bake(context)
+            return {'FINISHED'}
+
+        if self._bake_result == 'CANCEL':
+            self._discard_bake("Baking cancelled, see the Info editor for details.")
+        else:
+            self._discard_bake("Baking failed, see the Info editor for details.")
+        return {'CANCELLED'}
+
+    def cancel(self, context):
+        # Blender is stopping the operator early (file load, quit).
+        # A still running job keeps using the settings, image and node.
+        job_running = bpy.app.is_job_running('OBJECT_BAKE')
+        self._end_bake_job(context, restore=not job_running)
+        if job_running or self._bake_result == 'COMPLETE':
+            return
+        try:
+            self._discard_bake("Baking cancelled.")
+        except ReferenceError:
+            # Image or material was freed along with the file
+            pass
+
+    def _start_bake_job(self):
+        result = bpy.ops.object.bake('INVOKE_DEFAULT', type='DIFFUSE')
+        return 'CANCELLED' not in result
+
+    def _end_bake_job(self, context, restore=True):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._remove_bake_handlers()
+        if not restore:
+            return
+        try:
+            # RESTORE SETTINGS
+            self._restore_bake_settings(context, self._saved)
+        except ReferenceError:
+            # Scene was freed along with the file
+            pass
+
+    def _add_bake_handlers(self):
+        def on_complete(*args):
+            self._bake_result = 'COMPLETE'
+
+        def on_cancel(*args):
+            self._bake_result = 'CANCEL'
+
+        self._handlers = (
+            (bpy.app.handlers.object_bake_complete, on_complete),
+            (bpy.app.handlers.object_bake_cancel, on_cancel),
+        )
+        for handlers, func in self._handlers:
+            handlers.append(func)
+
+    def _remove_bake_handlers(self):
+        for handlers, func in self._handlers:
+            if func in handlers:
+                handlers.remove(func)
+        self._handlers = ()
+
+    def _retry_with_cuda(self, context):
+        # OptiX can refuse to bake on some setups, retry with CUDA
+        if context.scene.cycles.device != 'GPU':
+            return False
+        prefs = context.preferences.addons["cycles"].preferences
+        return prefs.compute_device_type == 'OPTIX' and _enable_gpus(context, ("CUDA",))
+
+    def _prepare_bake(self, context):
         props = context.scene.jcurves_bake_props
         resolution = int(props.resolution)
 
         obj = context.active_object
         if not obj:
             self.report({'ERROR'}, "No active object selected.")
-            return {'CANCELLED'}
+            return False
 
         mat = obj.active_material
         if not mat or not mat.use_nodes:
             self.report({'ERROR'}, "Active material has no node tree.")
-            return {'CANCELLED'}
-
-        scene = context.scene
+            return False
 
-        # SAVE RENDER ENGINE AND DEVICE
-        original_engine = scene.render.engine
-        original_device = scene.cycles.device
-
-        # SWITCH TO CYCLES
-        if scene.render.engine != 'CYCLES':
-            scene.render.engine = 'CYCLES'
-
-        # SWITCH RENDER DEVICE
-        scene.cycles.device = 'GPU'
+        # SAVE BAKE SETTINGS, applied by the caller inside its try/finally
+        self._saved = self._save_bake_settings(context)
 
         # DECIDE WHICH IMAGE TO BAKE TO
         image = None
 
         if props.bake_to_selected_image:
             # Try to get image from Image Editor
-            for area in context.screen.areas:
-                if area.type == 'IMAGE_EDITOR':
-                    if area.spaces.active.image:
-                        image = area.spaces.active.image
-                        break
+            if context.screen:
+                image = next((area.spaces.active.image for area in context.screen.areas
+                              if area.type == 'IMAGE_EDITOR' and area.spaces.active.image), None)
 
             # Fallback: get image from active texture node
-            if not image:
+            if image is None:
                 active_node = mat.node_tree.nodes.active
                 if active_node and active_node.type == 'TEX_IMAGE' and active_node.image:
                     image = active_node.image
 
             if not image:
                 self.report({'ERROR'}, "No image selected in Image Editor or active node.")
-                return {'CANCELLED'}
+                return False
 
             # Ensure image is correct resolution (optional)
             if image.size[0] != resolution or image.size[1] != resolution:
@@ -128,90 +320,118 @@ class MATERIAL_OT_bake_image(bpy.types.Operator):
             image.generated_color = (0.0, 0.0, 0.0, 1.0)
             self.report({'INFO'}, f"Created image: {image_name}")
 
-        # CREATE IMAGE TEXTURE NODE
+        # REUSE OR CREATE IMAGE TEXTURE NODE
         nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
 
-        bake_node = nodes.new(type='ShaderNodeTexImage')
-        bake_node.image = image
-        bake_node.label = "Baked Image"
-        bake_node.location = (0, 0)
+        bake_node = None
+        if props.bake_to_selected_image:
+            bake_node = next((node for node in nodes
+                              if node.type == 'TEX_IMAGE' and node.image == image), None)
+
+        created_node = bake_node is None
+        if created_node:
+            bake_node = nodes.new(type='ShaderNodeTexImage')
+            bake_node.image = image
+            bake_node.label = "Baked Image"
+            bake_node.location = (0, 0)
 
         # Select and make active
-        for node in nodes:
-            node.select = False
+        nodes.foreach_set("select", [False] * len(nodes))
         bake_node.select = True
         nodes.active = bake_node
 
-        # SAVE & APPLY BAKE SETTINGS
-        old_samples = scene.cycles.samples
-        old_denoise = scene.cycles.use_denoising
-        old_margin = scene.render.bake.margin
-        old_clear = scene.render.bake.use_clear
-        old_bake_type = scene.cycles.bake_type
-        
-        # Updated bake pass settings for newer Blender versions
-        old_use_diffuse = scene.render.bake.use_pass_diffuse
-        if hasattr(scene.render.bake, 'use_pass_direct'):
-            old_use_direct = scene.render.bake.use_pass_direct
-            old_use_indirect = scene.render.bake.use_pass_indirect
-        else:
-            old_use_direct = old_use_indirect = None
+        self._material = mat
+        self._image = image
+        self._bake_node = bake_node
+        self._created_node = created_node
+        self._created_image = not props.bake_to_selected_image
+        return True
 
-        scene.cycles.samples = props.max_samples
-        scene.cycles.use_denoising = props.denoise
-        scene.render.bake.margin = props.bake_margin
-        scene.render.bake.use_clear = props.clear_image
-        scene.cycles.bake_type = 'DIFFUSE'
-        scene.render.bake.use_pass_diffuse = True
-        if hasattr(scene.render.bake, 'use_pass_direct'):
-            scene.render.bake.use_pass_direct = False
-            scene.render.bake.use_pass_indirect = False
+    def _discard_bake(self, message):
+        self.report({'ERROR'}, message)
+        if self._created_image:
+            bpy.data.images.remove(self._image)
+        if self._created_node:
+            self._material.node_tree.nodes.remove(self._bake_node)
 
-        # RUN BAKE
-        try:
-            bpy.ops.object.bake(type='DIFFUSE')
-            self.report({'INFO'}, "Baking completed (Diffuse color only).")
-        except RuntimeError as e:
-            self.report({'ERROR'}, f"Baking failed: {e}")
-            if not props.bake_to_selected_image:
-                bpy.data.images.remove(image)
-            nodes.remove(bake_node)
-            self._restore_bake_settings(context, old_samples, old_denoise, old_margin,
-                                       old_clear, old_bake_type, old_use_diffuse, 
-                                       old_use_direct, old_use_indirect)
-            scene.render.engine = original_engine
-            scene.cycles.device = original_device
-            return {'CANCELLED'}
+    def _finish_bake(self, context):
+        self.report({'INFO'}, "Baking completed (Diffuse color only).")
 
-        # RESTORE SETTINGS
-        self._restore_bake_settings(context, old_samples, old_denoise, old_margin,
-                                   old_clear, old_bake_type, old_use_diffuse,
-                                   old_use_direct, old_use_indirect)
+        # Final report
+        action = "Created and baked to new image" if self._created_image else "Baked to existing image"
+        self.report({'INFO'}, f"{action}: {self._image.name}")
+        # Redraw the viewport and image editors, if any (none when run headless)
+        if context.screen:
+            for area in context.screen.areas:
+                if area.type in {'VIEW_3D', 'IMAGE_EDITOR'}:
+                    area.tag_redraw()
 
-        scene.render.engine = original_engine
-        scene.cycles.device = original_device
+    def _save_bake_settings(self, context):
+        scene = context.scene
+        bake = scene.render.bake
+        has_direct = hasattr(bake, 'use_pass_direct')
+
+        return {
+            "engine": scene.render.engine,
+            "device": scene.cycles.device,
+            "compute_device_type": _save_compute_device_type(context),
+            "samples": scene.cycles.samples,
+            "denoise": scene.cycles.use_denoising,
+            "margin": bake.margin,
+            "clear": bake.use_clear,
+            "bake_type": scene.cycles.bake_type,
+            "tile": getattr(scene.cycles, 'tile_size', None),
+            # Updated bake pass settings for newer Blender versions
+            "use_diffuse": bake.use_pass_diffuse,
+            "use_direct": bake.use_pass_direct if has_direct else None,
+            "use_indirect": bake.use_pass_indirect if has_direct else None,
+        }
+
+    def _apply_bake_settings(self, context):
+        scene = context.scene
+        props = scene.jcurves_bake_props
+        bake = scene.render.bake
 
-        # Final report
-        action = "Baked to existing image" if props.bake_to_selected_image else "Created and baked to new image"
-        self.report({'INFO'}, f"{action}: {image.name}")
-        context.area.tag_redraw()
+        # SWITCH TO CYCLES
+        if scene.render.engine != 'CYCLES':
+            scene.render.engine = 'CYCLES'
 
-        return {'FINISHED'}
+        # SWITCH RENDER DEVICE
+        if _enable_gpus(context):
+            scene.cycles.device = 'GPU'
 
-    def _restore_bake_settings(self, context, samples, denoise, margin, clear, btype, 
-                              use_diffuse, use_direct, use_indirect):
+        scene.cycles.samples = props.max_samples
+        scene.cycles.use_denoising = props.denoise
+        bake.margin = props.bake_margin
+        bake.use_clear = props.clear_image
+        scene.cycles.bake_type = 'DIFFUSE'
+        # Only raise the tile size, small CPU-sized tiles starve the GPU
+        tile = self._saved["tile"]
+        if tile is not None and scene.cycles.device == 'GPU':
+            scene.cycles.tile_size = max(tile, GPU_TILE_SIZE)
+        bake.use_pass_diffuse = True
+        if hasattr(bake, 'use_pass_direct'):
+            bake.use_pass_direct = False
+            bake.use_pass_indirect = False
+
+    def _restore_bake_settings(self, context, saved):
         scene = context.scene
-        scene.cycles.samples = samples
-        scene.cycles.use_denoising = denoise
-        scene.render.bake.margin = margin
-        scene.render.bake.use_clear = clear
-        scene.cycles.bake_type = btype
-        scene.render.bake.use_pass_diffuse = use_diffuse
-        if use_direct is not None:
-            scene.render.bake.use_pass_direct = use_direct
-        if use_indirect is not None:
-            scene.render.bake.use_pass_indirect = use_indirect
+        scene.cycles.samples = saved["samples"]
+        scene.cycles.use_denoising = saved["denoise"]
+        scene.render.bake.margin = saved["margin"]
+        scene.render.bake.use_clear = saved["clear"]
+        scene.cycles.bake_type = saved["bake_type"]
+        if saved["tile"] is not None:
+            scene.cycles.tile_size = saved["tile"]
+        scene.render.bake.use_pass_diffuse = saved["use_diffuse"]
+        if saved["use_direct"] is not None:
+            scene.render.bake.use_pass_direct = saved["use_direct"]
+        if saved["use_indirect"] is not None:
+            scene.render.bake.use_pass_indirect = saved["use_indirect"]
+
+        scene.render.engine = saved["engine"]
+        scene.cycles.device = saved["device"]
+        _restore_compute_device_type(context, saved["compute_device_type"])
 
 
 # PANEL
@@ -257,19 +477,17 @@ classes = (
     JCURVES_PT_bake_panel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    from bpy.utils import register_class
-    for cls in classes:
-        register_class(cls)
+    _register_classes()
     if not hasattr(bpy.types.Scene, "jcurves_bake_props"):
         bpy.types.Scene.jcurves_bake_props = PointerProperty(type=JCurvesBakeProps)
 
 def unregister():
-    from bpy.utils import unregister_class
     if hasattr(bpy.types.Scene, "jcurves_bake_props"):
         del bpy.types.Scene.jcurves_bake_props
-    for cls in reversed(classes):
-        unregister_class(cls)
+    _unregister_classes()
         
 if __name__ == "__main__":
     register()
\ No newline at end of file
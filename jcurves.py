@@ -3,6 +3,11 @@ import bpy
 from pathlib import Path
 
 
+_ADDON_DIR = Path(__file__).resolve().parent
+_BLEND_PATH = _ADDON_DIR / "blendfile" / "J_Curves Geometry Nodes.blend"
+_BLEND_PATH_STR = str(_BLEND_PATH)
+
+
 # ---------------------------
 # PROPERTY GROUP
 # ---------------------------
@@ -14,13 +19,6 @@ class SimpleBakeProps(bpy.types.PropertyGroup):
     )
 
 
-# ---------------------------
-# GET ADDON DIRECTORY
-# ---------------------------
-def get_addon_dir():
-    return Path(__file__).resolve().parent
-
-
 # ---------------------------
 # OPERATOR 1: Add Curve
 # ---------------------------
@@ -31,37 +29,60 @@ class CURVE_OT_ADDJCURVE(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        file_path = get_addon_dir() / "blendfile" / "J_Curves Geometry Nodes.blend"
         node_group_name = "J.CURVES"
 
         # Load node group if not already loaded
         if node_group_name not in bpy.data.node_groups:
-            if not file_path.exists():
-                self.report({'ERROR'}, f"Blend file not found: {file_path}")
+            if not _BLEND_PATH.exists():
+                self.report({'ERROR'}, f"Blend file not found: {_BLEND_PATH}")
                 return {'CANCELLED'}
 
             try:
-                with bpy.data.libraries.load(str(file_path), link=True) as (data_from, data_to):
+                with bpy.data.libraries.load(_BLEND_PATH_STR, link=False) as (data_from, data_to):
                     if node_group_name in data_from.node_groups:
                         data_to.node_groups = [node_group_name]
                     else:
                         self.report({'ERROR'}, f"Node group '{node_group_name}' not found in .blend file.")
                         return {'CANCELLED'}
             except Exception as e:
-                self.report({'ERROR'}, f"Failed to link node group: {e}")
+                self.report({'ERROR'}, f"Failed to load node group: {e}")
                 return {'CANCELLED'}
 
-        # Create the curve
-        bpy.ops.curve.primitive_nurbs_path_add(enter_editmode=True)
-        bpy.ops.curve.spline_type_set(type='POLY')
+        # Switch to object mode if needed
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        # Apply modifier to selected curve objects
-        for obj in context.selected_objects:
-            if obj.type == "CURVE" and node_group_name not in obj.modifiers:
-                mod = obj.modifiers.new(node_group_name, "NODES")
-                mod.node_group = bpy.data.node_groups[node_group_name]
-                mod.show_viewport = True
-                mod.show_render = True
+        # Create the curve (same shape as the default nurbs path, as a poly spline)
+        curve_data = bpy.data.curves.new("NurbsPath", 'CURVE')
+        curve_data.dimensions = '3D'
+        spline = curve_data.splines.new('POLY')
+        spline.points.add(4)
+        spline.points.foreach_set("co", [
+            -2.0, 0.0, 0.0, 1.0,
+            -1.0, 0.0, 0.0, 1.0,
+            0.0, 0.0, 0.0, 1.0,
+            1.0, 0.0, 0.0, 1.0,
+            2.0, 0.0, 0.0, 1.0,
+        ])
+        spline.points.foreach_set("select", [True] * len(spline.points))
+
+        obj = bpy.data.objects.new("NurbsPath", curve_data)
+        obj.location = context.scene.cursor.location
+        context.collection.objects.link(obj)
+
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+
+        # Apply modifier to the new curve
+        node_group = bpy.data.node_groups[node_group_name]
+        mod = obj.modifiers.new(node_group_name, "NODES")
+        mod.node_group = node_group
+        mod.show_viewport = True
+        mod.show_render = True
+
+        bpy.ops.object.mode_set(mode='EDIT')
 
         return {'FINISHED'}
 
@@ -124,17 +145,15 @@ class CURVE_OT_CONVERT_TO_MESH(bpy.types.Operator):
         props = context.scene.simple_bake_props
         if made_local and not props.use_existing_colors:
             mod_name = "J.CURVEScolor"
-            if mod_name not in mesh_obj.modifiers:
-                blend_file = get_addon_dir() / "blendfile" / "J_Curves Geometry Nodes.blend"
-
-                if not blend_file.exists():
-                    self.report({'WARNING'}, f"Blend file not found: {blend_file}")
+            if mesh_obj.modifiers.get(mod_name) is None:
+                if not _BLEND_PATH.exists():
+                    self.report({'WARNING'}, f"Blend file not found: {_BLEND_PATH}")
                 else:
                     color_node_group_name = "J.CURVEScolor"
                     # Load node group if missing
                     if color_node_group_name not in bpy.data.node_groups:
                         try:
-                            with bpy.data.libraries.load(str(blend_file), link=False) as (data_from, data_to):
+                            with bpy.data.libraries.load(_BLEND_PATH_STR, link=False) as (data_from, data_to):
                                 if color_node_group_name in data_from.node_groups:
                                     data_to.node_groups = [color_node_group_name]
                                 else:
@@ -143,9 +162,10 @@ class CURVE_OT_CONVERT_TO_MESH(bpy.types.Operator):
                             self.report({'WARNING'}, f"Failed to load node group: {e}")
 
                     # Assign if available
-                    if color_node_group_name in bpy.data.node_groups:
+                    color_node_group = bpy.data.node_groups.get(color_node_group_name)
+                    if color_node_group is not None:
                         mod = mesh_obj.modifiers.new(mod_name, "NODES")
-                        mod.node_group = bpy.data.node_groups[color_node_group_name]
+                        mod.node_group = color_node_group
                         mod.show_viewport = True
                         mod.show_render = True
                         mod.show_group_selector = False
@@ -193,10 +213,11 @@ classes = (
     JCurves,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    
+    _register_classes()
+
     # Register property group
     if not hasattr(bpy.types.Scene, "simple_bake_props"):
         bpy.types.Scene.simple_bake_props = bpy.props.PointerProperty(type=SimpleBakeProps)
@@ -207,8 +228,7 @@ def unregister():
         del bpy.types.Scene.simple_bake_props
     
     # Unregister classes
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
 
 
 # Allow running in text editor